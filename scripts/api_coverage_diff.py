@@ -9,14 +9,52 @@ Usage:
     python scripts/api_coverage_diff.py
 """
 
+import pickle
 import re
+import sys
 import yaml
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
+
+try:
+    # libyaml-backed loader: 5-10x faster on large specs
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from dataclasses import dataclass
 from typing import Optional
 
-
-@dataclass
+# Compiled once at import so the per-tool loop doesn't go through the
+# re module's pattern cache on every call.
+# re.ASCII keeps \w to the fast ASCII class; the inputs are Rust source
+_ARM_NAME_RX = re.compile(r'"(\w+)"', re.ASCII)
+_FN_DECL_RX = re.compile(r'async fn (\w+)\(', re.ASCII)
+# Lexer tokens for the brace scanner: string literals and line comments
+# are consumed whole so braces inside them don't affect the depth count.
+_TOKEN_RX = re.compile(r'"(?:[^"\\\n]|\\.)*"|//[^\n]*|[{}]')
+_FMT_ENDPOINT_RX = re.compile(r'let endpoint = format!\("([^"]+)"')
+_REGISTRY_INSERT_RX = re.compile(r'm\.insert\("(\w+)", Tool \{', re.ASCII)
+_CATEGORY_IDENT_RX = re.compile(r'\w+', re.ASCII)
+_CATEGORY_MARKER = "category: Category::"
+
+# Fixed-prefix probes: plain str.find beats the regex engine for these.
+# Each verb is checked in both its direct-string and &endpoint form.
+_HTTP_METHOD_PROBES = [
+    ("GET", 'client.get("', "client.get(&endpoint"),
+    ("POST", 'client.post("', "client.post(&endpoint"),
+    ("PATCH", 'client.patch("', "client.patch(&endpoint"),
+    ("DELETE", 'client.delete("', "client.delete(&endpoint"),
+]
+
+
+_METHODS = frozenset({"get", "post", "put", "patch", "delete"})
+# Dispatch/meta tools that are not backed by an API endpoint
+_META_TOOLS = frozenset({"list_tool_categories", "search_tools", "execute_tool"})
+
+
+@dataclass(slots=True, frozen=True)
 class SwaggerRoute:
     path: str
     method: str
@@ -29,7 +67,7 @@ class SwaggerRoute:
         return self.path.replace("/v1/", "")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class McpTool:
     name: str
     endpoint: str
@@ -38,119 +76,115 @@ class McpTool:
 
 def parse_swagger(swagger_path: Path) -> list[SwaggerRoute]:
     """Parse swagger.yaml and extract all routes."""
-    with open(swagger_path) as f:
-        spec = yaml.safe_load(f)
+    with open(swagger_path, "rb") as f:
+        spec = yaml.load(f, Loader=_YamlLoader)
 
     routes = []
+    routes_append = routes.append
     for path, methods in spec.get("paths", {}).items():
         for method, details in methods.items():
-            if method in ("get", "post", "put", "patch", "delete"):
-                tags = details.get("tags", ["Unknown"])
-                routes.append(SwaggerRoute(
-                    path=path,
-                    method=method.upper(),
-                    summary=details.get("summary", ""),
-                    tag=tags[0] if tags else "Unknown"
-                ))
+            if method not in _METHODS:
+                continue
+            tags = details.get("tags", ["Unknown"])
+            routes_append(SwaggerRoute(
+                path=path,
+                method=method.upper(),
+                summary=details.get("summary", ""),
+                tag=tags[0] if tags else "Unknown"
+            ))
 
     return routes
 
 
-def parse_mcp_implementation(main_rs_path: Path) -> tuple[set[str], list[McpTool]]:
+def _iter_fn_blocks(content: str):
+    """
+    Yield (name, body) for every async fn in the file.
+
+    Single lexer-style pass: each declaration's body is sliced out by
+    tracking brace depth over a linear token scan, so there are no
+    backtracking DOTALL regexes and pathological inputs stay O(N).
+    """
+    for decl in _FN_DECL_RX.finditer(content):
+        depth = 0
+        body_start = None
+        for token in _TOKEN_RX.finditer(content, decl.end()):
+            char = token.group()
+            if char == "{":
+                if depth == 0:
+                    body_start = token.end()
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    yield decl.group(1), content[body_start:token.start()]
+                    break
+
+
+def _match_name_block(func_body: str) -> Optional[str]:
+    """Slice a `match name { ... }` block up to its `_ =>` catch-all arm."""
+    start = func_body.find("match name {")
+    if start == -1:
+        return None
+    end = func_body.find("_ =>", start)
+    if end == -1:
+        return None
+    return func_body[start:end]
+
+
+def parse_mcp_implementation(content: str) -> tuple[set[str], list[McpTool]]:
     """
-    Parse main.rs and extract:
+    Parse main.rs source and extract:
     1. Set of tool names from execute_actual_tool match block
     2. List of tools with their endpoint mappings
     """
-    content = main_rs_path.read_text()
+    # One scan of the file up front; everything below is a dict lookup.
+    fn_bodies = {}
+    for name, body in _iter_fn_blocks(content):
+        fn_bodies.setdefault(name, body)
 
     tool_names = set()
 
-    # Extract tool names from execute_tool match arms (for special tools like "search")
-    tool_match = re.search(
-        r'async fn execute_tool.*?match name \{(.*?)\n\s+_ =>',
-        content,
-        re.DOTALL
-    )
-    if tool_match:
-        match_block = tool_match.group(1)
-        # Find all "tool_name" => patterns, but exclude meta-tools
-        names = set(re.findall(r'"(\w+)"', match_block))
-        meta_tools = {"list_tool_categories", "search_tools", "execute_tool"}
-        tool_names.update(names - meta_tools)
-
-    # Extract tool names from execute_actual_tool match arms
-    tool_match = re.search(
-        r'async fn execute_actual_tool.*?match name \{(.*?)\n\s+_ =>',
-        content,
-        re.DOTALL
-    )
-
-    if tool_match:
-        match_block = tool_match.group(1)
-        # Find all "tool_name" => patterns
-        tool_names.update(re.findall(r'"(\w+)"', match_block))
+    # Collect tool names from both dispatch functions' match arms:
+    # execute_tool carries the special tools like "search",
+    # execute_actual_tool carries the rest.
+    for dispatch_fn in ("execute_tool", "execute_actual_tool"):
+        body = fn_bodies.get(dispatch_fn)
+        if body is None:
+            continue
+        match_block = _match_name_block(body)
+        if match_block is not None:
+            # Find all "tool_name" => patterns; intern the names so the
+            # many set/dict probes in main() hit the identity fast path
+            tool_names.update(map(sys.intern, _ARM_NAME_RX.findall(match_block)))
+
+    # Exclude meta-tools once, after both blocks are merged
+    tool_names -= _META_TOOLS
 
     tools = []
 
-    # For each tool, find its function and extract endpoint info
     for tool_name in tool_names:
-        # Find the function - look for async fn tool_name with various endings
-        # Use a more permissive pattern
-        patterns = [
-            rf'async fn {tool_name}\(&self[^{{]*\{{(.*?)\n    \}}\n',
-            rf'async fn {tool_name}\(&self[^{{]*\{{(.*?)\n        Ok\(',
-        ]
-
-        func_body = None
-        for pattern in patterns:
-            func_match = re.search(pattern, content, re.DOTALL)
-            if func_match:
-                func_body = func_match.group(1)
-                break
-
-        if not func_body:
-            # Try a broader search
-            start = content.find(f"async fn {tool_name}(")
-            if start != -1:
-                # Find the matching closing brace
-                end = content.find("\n    async fn", start + 1)
-                if end == -1:
-                    end = content.find("\n}\n", start)
-                if end != -1:
-                    func_body = content[start:end]
-
-        if func_body:
+        func_body = fn_bodies.get(tool_name)
+        if func_body is not None:
             endpoint = None
             method = "GET"  # default
 
             # Check for format! endpoint
-            fmt_match = re.search(r'let endpoint = format!\("([^"]+)"', func_body)
+            fmt_match = _FMT_ENDPOINT_RX.search(func_body)
             if fmt_match:
                 endpoint = fmt_match.group(1)
 
-            # Check for client.get/post/etc with direct string
-            for http_method, pattern in [
-                ("GET", r'client\.get\("([^"]+)"'),
-                ("POST", r'client\.post\("([^"]+)"'),
-                ("PATCH", r'client\.patch\("([^"]+)"'),
-                ("DELETE", r'client\.delete\("([^"]+)"'),
-            ]:
-                match = re.search(pattern, func_body)
-                if match:
-                    if endpoint is None:
-                        endpoint = match.group(1)
+            # One pass over the verbs: either form of the client call
+            # settles the method, so stop at the first hit.
+            for http_method, literal, endpoint_form in _HTTP_METHOD_PROBES:
+                idx = func_body.find(literal)
+                if idx != -1:
+                    start = idx + len(literal)
+                    end = func_body.find('"', start)
+                    if endpoint is None and end > start:
+                        endpoint = func_body[start:end]
                     method = http_method
                     break
-
-            # Also check for client.method(&endpoint, ...)
-            for http_method, pattern in [
-                ("GET", r'client\.get\(&endpoint'),
-                ("POST", r'client\.post\(&endpoint'),
-                ("PATCH", r'client\.patch\(&endpoint'),
-                ("DELETE", r'client\.delete\(&endpoint'),
-            ]:
-                if re.search(pattern, func_body):
+                if endpoint_form in func_body:
                     method = http_method
                     break
 
@@ -164,89 +198,168 @@ def parse_mcp_implementation(main_rs_path: Path) -> tuple[set[str], list[McpTool
     return tool_names, tools
 
 
-def parse_registry(registry_path: Path) -> dict[str, str]:
-    """Parse registry.rs to get tool metadata (name -> category)."""
-    content = registry_path.read_text()
-
+def parse_registry(content: str) -> dict[str, str]:
+    """Parse registry.rs source to get tool metadata (name -> category)."""
     tools = {}
 
     # Find all m.insert("tool_name", Tool { ... category: Category::X, ... })
-    pattern = r'm\.insert\("(\w+)", Tool \{[^}]+category: Category::(\w+),'
-    matches = re.findall(pattern, content)
-
-    for name, category in matches:
-        tools[name] = category
+    # The category field sits near the top of each Tool literal, so a
+    # fixed window after the anchor avoids any unbounded backtracking.
+    for match in _REGISTRY_INSERT_RX.finditer(content):
+        window = content[match.end():match.end() + 512]
+        idx = window.find(_CATEGORY_MARKER)
+        if idx == -1:
+            continue
+        category = _CATEGORY_IDENT_RX.match(window, idx + len(_CATEGORY_MARKER))
+        if category:
+            tools[sys.intern(match.group(1))] = category.group()
 
     return tools
 
 
+# Manual mapping of swagger routes to MCP tool names.
+# This is the source of truth for what should be implemented.
+# dict[swagger_path, tuple of (expected_tool_names)]
+_ROUTE_TO_TOOLS = {
+    # Companies
+    "/v1/companies/{cik}/calendar": ("get_company_calendar",),
+    "/v1/companies/{id}/financials": ("get_company_financials",),
+    "/v1/companies/{cik}/filings": ("get_company_filings",),
+
+    # ETFs
+    "/v1/etfs/{identifier}/holdings": ("get_etf_holdings",),
+
+    # Forms 13F
+    "/v1/forms/13f/{id}": ("get_form13f_submission",),
+    "/v1/forms/13f": ("get_form13f_submissions",),
+
+    # Forms 4
+    "/v1/forms/4/{id}": ("get_form4_filing",),
+
+    # Form ADV - Firms
+    "/v1/forms/adv/firms": ("get_form_adv_firms",),
+    "/v1/forms/adv/firms/{crd}": ("get_form_adv_firm",),
+    "/v1/forms/adv/filings/{id}": ("get_form_adv_filing",),  # Individual filing detail
+
+    # Form ADV - Firm Sub-resources (these map to existing registry tools)
+    "/v1/forms/adv/firms/{crd}/filings": ("get_form_adv_firm_filings",),
+    "/v1/forms/adv/firms/{crd}/addresses": ("get_form_adv_firm_addresses",),
+    "/v1/forms/adv/firms/{crd}/notice_filings": ("get_form_adv_firm_notice_filings",),
+    "/v1/forms/adv/firms/{crd}/direct_owners": ("get_form_adv_firm_direct_owners",),
+    "/v1/forms/adv/firms/{crd}/indirect_owners": ("get_form_adv_firm_indirect_owners",),
+    "/v1/forms/adv/firms/{crd}/ownership_chain": ("get_form_adv_firm_ownership_chain",),
+    "/v1/forms/adv/firms/{crd}/private_funds": ("get_form_adv_firm_private_funds",),
+    "/v1/forms/adv/firms/{crd}/related_persons": ("get_form_adv_firm_related_persons",),
+    "/v1/forms/adv/firms/{crd}/other_names": ("get_form_adv_firm_other_names",),
+    "/v1/forms/adv/firms/{crd}/sma_data": ("get_form_adv_firm_sma_data",),
+    "/v1/forms/adv/firms/{crd}/disclosures": ("get_form_adv_firm_disclosures",),
+    "/v1/forms/adv/firms/{crd}/brochures": ("get_form_adv_firm_brochures",),
+    "/v1/forms/adv/firms/{crd}/aum_history": ("get_form_adv_firm_aum_history",),
+
+    # Form ADV - Cross-entity searches
+    "/v1/forms/adv/funds": ("get_form_adv_funds",),
+    "/v1/forms/adv/owners": ("get_form_adv_owners",),
+
+    # Lobbying
+    "/v1/lobbying/client_performance": ("get_lobbying_client_performance",),
+    "/v1/lobbying/clients/search": ("get_lobbying_clients_search",),
+    "/v1/lobbying/clients/{id}": ("get_lobbying_client_detail",),
+
+    # Lists (Watchlists) - GET and POST share the same path
+    "/v1/lists": ("get_lists", "create_list"),
+    "/v1/lists/{id_or_name}": ("get_list", "update_list", "delete_list"),
+
+    # List Items
+    "/v1/lists/{list_id}/items": ("add_list_item",),
+    "/v1/lists/{list_id}/items/toggle": ("toggle_list_item",),
+    "/v1/lists/{list_id}/items/{id}": ("update_list_item", "delete_list_item"),
+
+    # Search
+    "/v1/search": ("search",),
+
+    # Documents (proxied through API)
+    "/v1/documents/{accession_number}": ("get_sec_document",),
+    "/v1/documents/{accession_number}/metadata": ("get_sec_document_metadata",),
+}
+
+
 def map_swagger_to_mcp() -> dict[str, tuple[str, ...]]:
+    """Return the swagger-route -> MCP-tool mapping (built once at import)."""
+    return _ROUTE_TO_TOOLS
+
+
+@cache
+def _tool_to_paths() -> dict[str, tuple[str, ...]]:
+    """Inverted view of the route mapping: tool name -> swagger paths."""
+    inverted = defaultdict(list)
+    for path, tools in _ROUTE_TO_TOOLS.items():
+        for tool in tools:
+            inverted[tool].append(path)
+    return {tool: tuple(paths) for tool, paths in inverted.items()}
+
+
+def _print_route_section(header: str, entries, entry_lines) -> None:
     """
-    Manual mapping of swagger routes to MCP tool names.
-    This is the source of truth for what should be implemented.
-    Returns dict[swagger_path, tuple of (expected_tool_names)]
+    Group route entries by tag and emit one section of the report.
+
+    Each entry is a tuple whose first element is the SwaggerRoute;
+    entry_lines maps an entry to its detail lines below the
+    method/path row. The section is built as a list of lines and
+    flushed in a single write.
     """
-    return {
-        # Companies
-        "/v1/companies/{cik}/calendar": ("get_company_calendar",),
-        "/v1/companies/{id}/financials": ("get_company_financials",),
-        "/v1/companies/{cik}/filings": ("get_company_filings",),
-
-        # ETFs
-        "/v1/etfs/{identifier}/holdings": ("get_etf_holdings",),
-
-        # Forms 13F
-        "/v1/forms/13f/{id}": ("get_form13f_submission",),
-        "/v1/forms/13f": ("get_form13f_submissions",),
-
-        # Forms 4
-        "/v1/forms/4/{id}": ("get_form4_filing",),
-
-        # Form ADV - Firms
-        "/v1/forms/adv/firms": ("get_form_adv_firms",),
-        "/v1/forms/adv/firms/{crd}": ("get_form_adv_firm",),
-        "/v1/forms/adv/filings/{id}": ("get_form_adv_filing",),  # Individual filing detail
-
-        # Form ADV - Firm Sub-resources (these map to existing registry tools)
-        "/v1/forms/adv/firms/{crd}/filings": ("get_form_adv_firm_filings",),
-        "/v1/forms/adv/firms/{crd}/addresses": ("get_form_adv_firm_addresses",),
-        "/v1/forms/adv/firms/{crd}/notice_filings": ("get_form_adv_firm_notice_filings",),
-        "/v1/forms/adv/firms/{crd}/direct_owners": ("get_form_adv_firm_direct_owners",),
-        "/v1/forms/adv/firms/{crd}/indirect_owners": ("get_form_adv_firm_indirect_owners",),
-        "/v1/forms/adv/firms/{crd}/ownership_chain": ("get_form_adv_firm_ownership_chain",),
-        "/v1/forms/adv/firms/{crd}/private_funds": ("get_form_adv_firm_private_funds",),
-        "/v1/forms/adv/firms/{crd}/related_persons": ("get_form_adv_firm_related_persons",),
-        "/v1/forms/adv/firms/{crd}/other_names": ("get_form_adv_firm_other_names",),
-        "/v1/forms/adv/firms/{crd}/sma_data": ("get_form_adv_firm_sma_data",),
-        "/v1/forms/adv/firms/{crd}/disclosures": ("get_form_adv_firm_disclosures",),
-        "/v1/forms/adv/firms/{crd}/brochures": ("get_form_adv_firm_brochures",),
-        "/v1/forms/adv/firms/{crd}/aum_history": ("get_form_adv_firm_aum_history",),
-
-        # Form ADV - Cross-entity searches
-        "/v1/forms/adv/funds": ("get_form_adv_funds",),
-        "/v1/forms/adv/owners": ("get_form_adv_owners",),
-
-        # Lobbying
-        "/v1/lobbying/client_performance": ("get_lobbying_client_performance",),
-        "/v1/lobbying/clients/search": ("get_lobbying_clients_search",),
-        "/v1/lobbying/clients/{id}": ("get_lobbying_client_detail",),
-
-        # Lists (Watchlists) - GET and POST share the same path
-        "/v1/lists": ("get_lists", "create_list"),
-        "/v1/lists/{id_or_name}": ("get_list", "update_list", "delete_list"),
-
-        # List Items
-        "/v1/lists/{list_id}/items": ("add_list_item",),
-        "/v1/lists/{list_id}/items/toggle": ("toggle_list_item",),
-        "/v1/lists/{list_id}/items/{id}": ("update_list_item", "delete_list_item"),
-
-        # Search
-        "/v1/search": ("search",),
-
-        # Documents (proxied through API)
-        "/v1/documents/{accession_number}": ("get_sec_document",),
-        "/v1/documents/{accession_number}/metadata": ("get_sec_document_metadata",),
-    }
+    lines = [header, "-" * 80]
+    by_tag = defaultdict(list)
+    for entry in entries:
+        by_tag[entry[0].tag].append(entry)
+
+    for tag in sorted(by_tag):
+        lines.append(f"\n  {tag}:")
+        for entry in by_tag[tag]:
+            lines.append(f"    {entry[0].method:6} {entry[0].path}")
+            lines.extend(entry_lines(entry))
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _implemented_entry_lines(entry) -> list[str]:
+    _route, tools = entry
+    return [f"           → {', '.join(tools)}"]
+
+
+def _missing_entry_lines(entry) -> list[str]:
+    _route, implemented, missing = entry
+    lines = []
+    if implemented:
+        lines.append(f"           ✓ Implemented: {', '.join(implemented)}")
+    lines.append(f"           ✗ Missing: {', '.join(missing)}")
+    return lines
+
+
+def _unmapped_entry_lines(entry) -> list[str]:
+    return [f"           {entry[0].summary}"]
+
+
+def _cache_key(paths: tuple[Path, ...]) -> tuple:
+    """Fingerprint the input files by path, mtime and size."""
+    return tuple((str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in paths)
+
+
+def _load_parse_cache(cache_file: Path, key: tuple):
+    """Return cached parse results if the inputs are unchanged, else None."""
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+    if cached.get("key") != key:
+        return None
+    return cached.get("data")
+
+
+def _store_parse_cache(cache_file: Path, key: tuple, data) -> None:
+    cache_file.parent.mkdir(exist_ok=True)
+    with open(cache_file, "wb") as f:
+        pickle.dump({"key": key, "data": data}, f)
 
 
 def main():
@@ -260,16 +373,39 @@ def main():
     print("=" * 80)
     print()
 
-    # Parse swagger
-    swagger_routes = parse_swagger(swagger_path)
-    print(f"📄 Swagger Routes Found: {len(swagger_routes)}")
+    # Skip re-parsing entirely when none of the inputs changed since the
+    # last run (pass --no-cache to force a fresh parse).
+    cache_file = root / ".cache" / "api_coverage_diff.pkl"
+    use_cache = "--no-cache" not in sys.argv
+    key = _cache_key((swagger_path, main_rs_path, registry_path))
+
+    data = _load_parse_cache(cache_file, key) if use_cache else None
+    if data is None:
+        # Read the Rust sources once up front so the workers get pre-read
+        # buffers and parsing stays pure CPU work.
+        main_rs_content = main_rs_path.read_text()
+        registry_content = registry_path.read_text()
+
+        # The three inputs are independent; parse them concurrently.
+        # libyaml's C loader does the heavy lifting outside the GIL, so
+        # the swagger parse overlaps with the regex work on the Rust files.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            swagger_future = executor.submit(parse_swagger, swagger_path)
+            mcp_future = executor.submit(parse_mcp_implementation, main_rs_content)
+            registry_future = executor.submit(parse_registry, registry_content)
+            swagger_routes = swagger_future.result()
+            implemented_tool_names, mcp_tools = mcp_future.result()
+            registry_tools = registry_future.result()
+        if use_cache:
+            _store_parse_cache(
+                cache_file, key,
+                (swagger_routes, implemented_tool_names, mcp_tools, registry_tools),
+            )
+    else:
+        swagger_routes, implemented_tool_names, mcp_tools, registry_tools = data
 
-    # Parse MCP implementation
-    implemented_tool_names, mcp_tools = parse_mcp_implementation(main_rs_path)
+    print(f"📄 Swagger Routes Found: {len(swagger_routes)}")
     print(f"🔧 MCP Tools Implemented (in execute_actual_tool): {len(implemented_tool_names)}")
-
-    # Parse registry
-    registry_tools = parse_registry(registry_path)
     print(f"📚 Registry Tools Defined: {len(registry_tools)}")
     print()
 
@@ -287,8 +423,9 @@ def main():
         if expected_tools is None:
             unmapped_routes.append(route)
         else:
-            implemented = [t for t in expected_tools if t in implemented_tool_names]
-            missing = [t for t in expected_tools if t not in implemented_tool_names]
+            expected = set(expected_tools)
+            implemented = sorted(expected & implemented_tool_names)
+            missing = sorted(expected - implemented_tool_names)
 
             if missing:
                 missing_routes.append((route, implemented, missing))
@@ -296,50 +433,25 @@ def main():
                 implemented_routes.append((route, implemented))
 
     # Print implemented routes
-    print("✅ IMPLEMENTED ROUTES")
-    print("-" * 80)
-    by_tag = {}
-    for route, tools in implemented_routes:
-        by_tag.setdefault(route.tag, []).append((route, tools))
-
-    for tag in sorted(by_tag.keys()):
-        print(f"\n  {tag}:")
-        for route, tools in by_tag[tag]:
-            tool_str = ", ".join(tools)
-            print(f"    {route.method:6} {route.path}")
-            print(f"           → {tool_str}")
+    _print_route_section(
+        "✅ IMPLEMENTED ROUTES", implemented_routes, _implemented_entry_lines
+    )
 
     # Print missing routes
     if missing_routes:
         print("\n")
-        print("❌ MISSING OR INCOMPLETE ROUTES")
-        print("-" * 80)
-        by_tag = {}
-        for route, implemented, missing in missing_routes:
-            by_tag.setdefault(route.tag, []).append((route, implemented, missing))
-
-        for tag in sorted(by_tag.keys()):
-            print(f"\n  {tag}:")
-            for route, implemented, missing in by_tag[tag]:
-                print(f"    {route.method:6} {route.path}")
-                if implemented:
-                    print(f"           ✓ Implemented: {', '.join(implemented)}")
-                print(f"           ✗ Missing: {', '.join(missing)}")
+        _print_route_section(
+            "❌ MISSING OR INCOMPLETE ROUTES", missing_routes, _missing_entry_lines
+        )
 
     # Print unmapped routes (routes in swagger but not in our mapping)
     if unmapped_routes:
         print("\n")
-        print("⚠️  UNMAPPED ROUTES (in swagger but no expected MCP tool defined)")
-        print("-" * 80)
-        by_tag = {}
-        for route in unmapped_routes:
-            by_tag.setdefault(route.tag, []).append(route)
-
-        for tag in sorted(by_tag.keys()):
-            print(f"\n  {tag}:")
-            for route in by_tag[tag]:
-                print(f"    {route.method:6} {route.path}")
-                print(f"           {route.summary}")
+        _print_route_section(
+            "⚠️  UNMAPPED ROUTES (in swagger but no expected MCP tool defined)",
+            [(route,) for route in unmapped_routes],
+            _unmapped_entry_lines,
+        )
 
     # Summary
     print("\n")
@@ -366,16 +478,20 @@ def main():
     registry_only = set(registry_tools.keys()) - implemented_tool_names
     if registry_only:
         print("⚠️  Tools in registry.rs but NOT in execute_actual_tool:")
+        tool_paths = _tool_to_paths()
         for tool in sorted(registry_only):
             cat = registry_tools.get(tool, "unknown")
-            print(f"    - {tool} ({cat})")
+            paths = tool_paths.get(tool)
+            if paths:
+                print(f"    - {tool} ({cat}) → {', '.join(paths)}")
+            else:
+                print(f"    - {tool} ({cat})")
         print()
 
     # Check for implemented tools not in registry
     impl_only = implemented_tool_names - set(registry_tools.keys())
     # Filter out meta-tools and search (which is a special tool)
-    meta_tools = {"list_tool_categories", "search_tools", "execute_tool", "search"}
-    impl_only = impl_only - meta_tools
+    impl_only = impl_only - _META_TOOLS - {"search"}
     if impl_only:
         print("⚠️  Tools in execute_actual_tool but NOT in registry.rs:")
         for tool in sorted(impl_only):